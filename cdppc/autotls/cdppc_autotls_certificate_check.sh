@@ -28,7 +28,7 @@ function run_as_root_check ()
 # Function: do_check_open_port - Validate if the TCP port is open {{{1
 #-----------------------------------------------------------------------
 function do_check_open_port () {
-    timeout 2 bash -c "nc -z ${HOST_FQDN} ${HOST_SSL_PORT} >/dev/null 2>&1"
+    timeout 2 nc -z ${HOST_FQDN} ${HOST_SSL_PORT} >/dev/null 2>&1
     if [[ $? -ne 0 ]]
     then
         echo -e "\nThe connection to ==> ${RED}${HOST_FQDN}:${HOST_SSL_PORT}${NC} <== is not possible, the port is Closed\n"
@@ -59,7 +59,7 @@ function do_spin ()
     spinner="/|\\-/|\\-"
     while :
     do
-        for i in $(seq 0 7)
+        for i in {0..7}
         do
             echo -n "${spinner:$i:1}"
             echo -en "\010"
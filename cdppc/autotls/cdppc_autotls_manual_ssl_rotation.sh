@@ -25,7 +25,7 @@ function do_spin () {
   spinner="/|\\-/|\\-"
   while :
   do
-    for i in $(seq 0 7)
+    for i in {0..7}
     do
       echo -n "${spinner:$i:1}"
       echo -en "\010"
@@ -36,7 +36,7 @@ function do_spin () {
 
 function do_spinner () {
   spinner="/|\\-/|\\-"
-  for i in $(seq 0 7)
+  for i in {0..7}
   do
     echo -n "${spinner:$i:1}"
     echo -en "\010"
@@ -98,9 +98,8 @@ function do_rotate_certificates () {
 
 function do_restart_cm_mgmt () {
   echo "Restarting MGMT Services"
-  for MGMT_ROLE in $(curl -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+  for MGMT_ROLE_TYPE in $(curl -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
   do
-    MGMT_ROLE_TYPE=$(curl -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
     curl -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/restart"
   done
   
@@ -108,7 +107,7 @@ function do_restart_cm_mgmt () {
   spinner="/|\\-/|\\-"
   until [[ $(echo exit | /opt/cloudera/cm-agent/bin/supervisorctl -c /var/run/cloudera-scm-agent/supervisor/supervisord.conf | awk '/cloudera-mgmt/ {print $2}' | sort -u) = "RUNNING" ]]
   do
-    for i in $(seq 0 7)
+    for i in {0..7}
     do
       echo -n "${spinner:$i:1}"
       echo -en "\010"
@@ -132,7 +131,7 @@ function do_restart_cm () {
 
   while [[ $(curl -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/commands" | jq -r '.items[].name') == "Restart" ]]
   do
-    for i in $(seq 0 7)
+    for i in {0..7}
     do
       echo -n "${spinner:$i:1}"
       echo -en "\010"
@@ -196,7 +195,7 @@ do
   esac
 done
 echo
-curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/version" > /tmp/null 2>&1
+curl -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -X GET "${CM_SERVER}/api/version" > /tmp/null 2>&1
 if grep "Bad credentials" /tmp/null > /dev/null 2>&1
 then
   CRED_VALIDATED=1
@@ -204,11 +203,18 @@ then
   rm -rf /tmp/null 
 else
   CRED_VALIDATED=0
+  CM_API_VERSION=$(cat /tmp/null)
   rm -rf /tmp/null 
+  # The body is reused as the API version, so it must look like one (e.g. v51)
+  if [[ ! ${CM_API_VERSION} =~ ^v[0-9]+$ ]]
+  then
+    CRED_VALIDATED=1
+    echo -e "\n===> ${RED}Unexpected answer from ${CM_SERVER}/api/version${NC} <===\n"
+  fi
 fi
 if [[ ${CRED_VALIDATED} == 0 ]]
 then
- export CM_API_VERSION=$(curl  -s -L -k -u "${WORKLOAD_USER}:${WORKLOAD_USER_PASS}" --noproxy '*' -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/version")
+ export CM_API_VERSION
 else
  exit 1
 fi
@@ -69,7 +69,7 @@ function do_spin ()
     spinner="/|\\-/|\\-"
     while :
     do
-        for i in $(seq 0 7)
+        for i in {0..7}
         do
             echo -n "${spinner:$i:1}"
             echo -en "\010"
@@ -143,15 +143,16 @@ function do_env_freeipa_status ()
     ENVIRONMENT_NAME=$1
     PROFILE=${CDP_PROFILE_ANSWER}
 
-    cdp --profile ${PROFILE} environments describe-environment --environment-name ${ENVIRONMENT_NAME} >/dev/null 2>&1
+    # Describe the Environment only once and reuse the output
+    ENVIRONMENT_JSON=$(cdp --profile ${PROFILE} environments describe-environment --environment-name ${ENVIRONMENT_NAME} 2>/dev/null)
 
     if [[ $? -ne 0 ]]
     then
         echo -e "\n${RED}Something went wrong. Please confirm${NC} << ${ENVIRONMENT_NAME} >>${RED} is a valid Environment Name${NC}\n"
         exit 1
     else
-        echo -e "\n${RED}==> Environment:${NC} $(cdp --profile ${PROFILE} environments describe-environment --environment-name ${ENVIRONMENT_NAME} 2>/dev/null | jq -r '.[] | "\(.environmentName) | STATUS => \(.status) | CLOUD PLATFORM => \(.cloudPlatform)"')"
-        export ENVIRONMENT_CRN=$(cdp --profile ${PROFILE} environments describe-environment --environment-name ${ENVIRONMENT_NAME} 2>/dev/null | jq -r '.environment.crn')
+        echo -e "\n${RED}==> Environment:${NC} $(echo "${ENVIRONMENT_JSON}" | jq -r '.[] | "\(.environmentName) | STATUS => \(.status) | CLOUD PLATFORM => \(.cloudPlatform)"')"
+        export ENVIRONMENT_CRN=$(echo "${ENVIRONMENT_JSON}" | jq -r '.environment.crn')
         echo ${ENVIRONMENT_CRN}
         echo -e "\n${YELLOW}FreeIPA${NC}\n"
         cdp --profile ${PROFILE} environments get-freeipa-status --environment-name  ${ENVIRONMENT_NAME} 2>/dev/null | jq -r '.'
@@ -172,13 +173,15 @@ function do_datalake_status ()
     do_spin &
     SPIN_PID=$!
     
-    if [[ $(echo "cdp --profile ${PROFILE} datalake list-datalakes 2>/dev/null | jq -r '.datalakes[] | select (.environmentCrn | contains(\"${ENVIRONMENT_CRN}\")) | \"\(.datalakeName)\"'" | bash | wc -l) -ne 0 ]]
+    # List the Data Lakes only once and reuse the result for the check and the lookup
+    DATALAKE_NAME=$(cdp --profile ${PROFILE} datalake list-datalakes 2>/dev/null | jq -r --arg ENV_CRN "${ENVIRONMENT_CRN}" '.datalakes[] | select (.environmentCrn | contains($ENV_CRN)) | "\(.datalakeName)"')
+    if [[ -n ${DATALAKE_NAME} ]]
     then
-        DATALAKE_NAME=$(echo "cdp --profile ${PROFILE} datalake list-datalakes 2>/dev/null | jq -r '.datalakes[] | select (.environmentCrn | contains(\"${ENVIRONMENT_CRN}\")) | \"\(.datalakeName)\"'" | bash)
-        echo -e "\n${YELLOW}==> Data Lake:${NC} $(cdp --profile ${PROFILE} datalake describe-datalake --datalake-name ${DATALAKE_NAME} 2>/dev/null | jq -r '.[] | "\(.datalakeName) | SHAPE => \(.shape) | STATUS => \(.status)"')"
-        export DATALAKE_CRN=$(cdp --profile ${PROFILE}  datalake describe-datalake --datalake-name ${DATALAKE_NAME} 2>/dev/null | jq -r '.datalake.crn')
+        DATALAKE_JSON=$(cdp --profile ${PROFILE} datalake describe-datalake --datalake-name ${DATALAKE_NAME} 2>/dev/null)
+        echo -e "\n${YELLOW}==> Data Lake:${NC} $(echo "${DATALAKE_JSON}" | jq -r '.[] | "\(.datalakeName) | SHAPE => \(.shape) | STATUS => \(.status)"')"
+        export DATALAKE_CRN=$(echo "${DATALAKE_JSON}" | jq -r '.datalake.crn')
         echo ${DATALAKE_CRN}
-        DATALAKE_STATE="$(cdp --profile ${PROFILE}  datalake describe-datalake --datalake-name ${DATALAKE_NAME} 2>/dev/null | jq -r '.[].status')"
+        DATALAKE_STATE="$(echo "${DATALAKE_JSON}" | jq -r '.[].status')"
         if [[ ${DATALAKE_STATE} == "RUNNING" ]]
         then
             echo -e "${YELLOW}\nCluster service status${NC}\n"
@@ -194,6 +197,25 @@ function do_datalake_status ()
     wait $SPIN_PID >/dev/null 2>&1
 }
 
+# Function: do_datahub_cluster_status - Get the status of a single Datahub  {{{1
+#-----------------------------------------------------------------------
+function do_datahub_cluster_status () 
+{
+    DATAHUB_NAME=$1
+    DATAHUB_JSON=$(cdp --profile ${PROFILE} datahub describe-cluster --cluster-name ${DATAHUB_NAME} 2>/dev/null)
+    echo -e "\n${BLUE}==> Datahub:${NC} $(echo "${DATAHUB_JSON}" | jq -r '.[] | "\(.clusterName) | STATUS => \(.status) | CLUSTER STATUS => \(.clusterStatus)"')"
+    DATAHUB_CRN=$(echo "${DATAHUB_JSON}" | jq -r '.cluster.crn')
+    echo ${DATAHUB_CRN}
+
+    if [[ $(echo "${DATAHUB_JSON}" | jq -r '.[].status') != "STOPPED" ]]
+    then
+        echo -e "\n${YELLOW}Cluster service status${NC}\n"
+        cdp --profile ${PROFILE} datahub get-cluster-service-status --cluster-name ${DATAHUB_NAME} | jq -r '.services[] | "SERVICE => \(.type) | STATE => \(.state) | HEALTH SUMMARY =>  \(.healthSummary)"'
+        echo -e "\n${YELLOW}Hosts status${NC}\n"
+        cdp --profile ${PROFILE} datahub get-cluster-host-status --cluster-name ${DATAHUB_NAME} | jq -r '.hosts[] | "\(.hostname) | HEALTH SUMMARY => \(.healthSummary)"'
+    fi
+}
+
 # Function: do_datahub_status - Get the Datahub status per Env  {{{1
 #-----------------------------------------------------------------------
 function do_datahub_status () 
@@ -205,22 +227,43 @@ function do_datahub_status ()
     do_spin &
     SPIN_PID=$!
     
-    if [[ $(echo "cdp --profile ${PROFILE} datahub list-clusters 2>/dev/null | jq -r '.clusters[] | select (.environmentCrn | contains(\"${ENVIRONMENT_CRN}\")) | \"\(.clusterName)\"'" | bash | wc -l) -ne 0 ]]
+    # List the Datahubs only once and reuse the result for the check and the loop
+    DATAHUB_NAMES=$(cdp --profile ${PROFILE} datahub list-clusters 2>/dev/null | jq -r --arg ENV_CRN "${ENVIRONMENT_CRN}" '.clusters[] | select (.environmentCrn | contains($ENV_CRN)) | "\(.clusterName)"')
+    if [[ -n ${DATAHUB_NAMES} ]]
     then
-        for DATAHUB_NAME in $(echo "cdp --profile ${PROFILE} datahub list-clusters 2>/dev/null | jq -r '.clusters[] | select (.environmentCrn | contains(\"${ENVIRONMENT_CRN}\")) | \"\(.clusterName)\"'" | bash)
+        # Query the Datahubs in the background in batches of 8, and print the results in the listed order
+        DATAHUB_MAX_JOBS=8
+        DATAHUB_OUTPUT_DIR=$(mktemp -d)
+        DATAHUB_PIDS=""
+        trap "rm -rf ${DATAHUB_OUTPUT_DIR}" EXIT
+        # Background jobs ignore SIGINT, so stop them and the spinner before leaving
+        trap 'kill ${DATAHUB_PIDS} ${SPIN_PID} 2>/dev/null; rm -rf ${DATAHUB_OUTPUT_DIR}; exit 1' INT TERM
+        BATCH_PIDS=""
+        BATCH_COUNT=0
+        for DATAHUB_NAME in ${DATAHUB_NAMES}
         do
-            echo -e "\n${BLUE}==> Datahub:${NC} $(cdp --profile ${PROFILE} datahub describe-cluster --cluster-name ${DATAHUB_NAME} 2>/dev/null | jq -r '.[] | "\(.clusterName) | STATUS => \(.status) | CLUSTER STATUS => \(.clusterStatus)"')"
-            DATAHUB_CRN=$(cdp --profile ${PROFILE}  datahub describe-cluster --cluster-name ${DATAHUB_NAME} 2>/dev/null | jq -r '.cluster.crn')
-            echo ${DATAHUB_CRN}
-
-            if [[ $(cdp --profile ${PROFILE} datahub describe-cluster --cluster-name ${DATAHUB_NAME} 2>/dev/null | jq -r '.[].status') != "STOPPED" ]]
+            do_datahub_cluster_status ${DATAHUB_NAME} > ${DATAHUB_OUTPUT_DIR}/${DATAHUB_NAME} 2>&1 &
+            DATAHUB_PIDS="${DATAHUB_PIDS} $!"
+            BATCH_PIDS="${BATCH_PIDS} $!"
+            (( BATCH_COUNT += 1 ))
+            if [[ ${BATCH_COUNT} -eq ${DATAHUB_MAX_JOBS} ]]
             then
-                echo -e "\n${YELLOW}Cluster service status${NC}\n"
-                cdp --profile ${PROFILE} datahub get-cluster-service-status --cluster-name ${DATAHUB_NAME} | jq -r '.services[] | "SERVICE => \(.type) | STATE => \(.state) | HEALTH SUMMARY =>  \(.healthSummary)"'
-                echo -e "\n${YELLOW}Hosts status${NC}\n"
-                cdp --profile ${PROFILE} datahub get-cluster-host-status --cluster-name ${DATAHUB_NAME} | jq -r '.hosts[] | "\(.hostname) | HEALTH SUMMARY => \(.healthSummary)"'
+                wait ${BATCH_PIDS}
+                BATCH_PIDS=""
+                BATCH_COUNT=0
             fi
         done
+        # A bare wait would also wait for the spinner, so only wait when a partial batch is left
+        if [[ -n ${BATCH_PIDS} ]]
+        then
+            wait ${BATCH_PIDS}
+        fi
+        for DATAHUB_NAME in ${DATAHUB_NAMES}
+        do
+            cat ${DATAHUB_OUTPUT_DIR}/${DATAHUB_NAME}
+        done
+        rm -rf ${DATAHUB_OUTPUT_DIR}
+        trap - EXIT INT TERM
     else
         echo -e "\n${YELLOW}No Datahubs on this Environment${NC}\n"
     fi
@@ -69,8 +69,7 @@ EOF
 function get_user_keytab ()
 {
     echo "Extracting the ${UserName} keytab for ${EnvName}"
-    #UserCRN=$(cdp iam list-users --max-items 1500 | jq -r --arg WL_USER_NAME ${UserName} '.users[]|select(.workloadUsername == $WL_USER_NAME)|(.crn)') 
-    UserCRN=$(echo "cdp iam list-users --max-items 1500 | jq -r '.users[]|select(.workloadUsername == \"${UserName}\")|(.crn)'" | bash)     
+    UserCRN=$(cdp iam list-users --max-items 1500 | jq -r --arg WL_USER_NAME "${UserName}" '.users[]|select(.workloadUsername == $WL_USER_NAME)|(.crn)')
     cdp environments get-keytab --environment ${EnvName} --actor-crn "${UserCRN}"| jq -r '.contents'| base64 --decode > ${Temporal_keytab}
 }
 
@@ -79,8 +78,7 @@ function get_user_keytab ()
 function get_machine_user_keytab ()
 {
     echo "Extracting the ${UserName} keytab for ${EnvName}"
-    #UserCRN=$(cdp iam list-machine-users --max-items 1500 | jq -r --arg WL_USER_NAME ${UserName} '.users[]|select(.workloadUsername == $WL_USER_NAME)|(.crn)') 
-    UserCRN=$(echo "cdp iam list-machine-users --max-items 1500 | jq -r '.machineUsers[]|select(.workloadUsername == \"${UserName}\")|(.crn)'" | bash)         
+    UserCRN=$(cdp iam list-machine-users --max-items 1500 | jq -r --arg WL_USER_NAME "${UserName}" '.machineUsers[]|select(.workloadUsername == $WL_USER_NAME)|(.crn)')
     cdp environments get-keytab --environment ${EnvName} --actor-crn "${UserCRN}"| jq -r '.contents'| base64 --decode > ${Temporal_keytab}
 }
 
@@ -33,6 +33,7 @@ function do_test_credentials ()
     rm -rf /tmp/null 
   else
     CRED_VALIDATED=0
+    CM_API_VERSION=$(cat /tmp/null)
     rm -rf /tmp/null 
   fi
 }
@@ -80,9 +81,8 @@ function cluster_mgmt_service_restart ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_restart_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/restart"
     done
 }
@@ -130,43 +130,40 @@ function main ()
 
     if [[ ${CRED_VALIDATED} == 0 ]]
     then
-    export CM_API_VERSION=$(curl ${CURL_OPTIONS}  -X GET "${CM_SERVER}/api/version")
+    export CM_API_VERSION
     else
     exit 1
     fi
 
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
+        PS3="What do you want to do for << ${MGMT_ROLE_TYPE^^} >> Service? [-> To get the Menu Press Enter]: "
+        echo -e "\n#== CLUSTER: ${CM_CLUSTER_NAME} | SERVICE: ${MGMT_ROLE_TYPE^^} ==#\n"
+        select ANSWER in "Start" "Stop" "Restart" "Next Service" "Restart All" "Exit"
         do
-            PS3="What do you want to do for << ${MGMT_ROLE_TYPE^^} >> Service? [-> To get the Menu Press Enter]: "
-            echo -e "\n#== CLUSTER: ${CM_CLUSTER_NAME} | SERVICE: ${MGMT_ROLE_TYPE^^} ==#\n"
-            select ANSWER in "Start" "Stop" "Restart" "Next Service" "Restart All" "Exit"
-            do
-                case ${ANSWER} in
-                    "Start")
-                        cluster_mgmt_service_start
-                        ;;
-                    "Stop")
-                        cluster_mgmt_service_stop
-                        ;;
-                    "Restart")
-                        cluster_mgmt_service_restart
-                        ;;
-                    "Next Service")
-                        break
-                        ;;
-                    "Restart All")
-                        echo -e "\nRestarting:\n$(curl ${CURL_OPTIONS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleTypes"| jq -r '.[]')\n"
-                        cluster_mgmt_service_restart_all
-                        ;;
-                    "Exit")
-                        exit 0
+            case ${ANSWER} in
+                "Start")
+                    cluster_mgmt_service_start
                     ;;
-                    *) 
-                        echo -e "\nInvalid option, please try again. [-> To get the Menu Press Enter]:\n"
-                esac
-            done
+                "Stop")
+                    cluster_mgmt_service_stop
+                    ;;
+                "Restart")
+                    cluster_mgmt_service_restart
+                    ;;
+                "Next Service")
+                    break
+                    ;;
+                "Restart All")
+                    echo -e "\nRestarting:\n$(curl ${CURL_OPTIONS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleTypes"| jq -r '.[]')\n"
+                    cluster_mgmt_service_restart_all
+                    ;;
+                "Exit")
+                    exit 0
+                ;;
+                *) 
+                    echo -e "\nInvalid option, please try again. [-> To get the Menu Press Enter]:\n"
+            esac
         done
     done
 }
@@ -24,6 +24,7 @@ function do_test_credentials ()
     rm -rf /tmp/null 
   else
     CRED_VALIDATED=0
+    CM_API_VERSION=$(cat /tmp/null)
     rm -rf /tmp/null 
   fi
 }
@@ -53,7 +54,7 @@ function do_spin ()
     spinner="/|\\-/|\\-"
     while :
     do
-        for i in $(seq 0 7)
+        for i in {0..7}
         do
             echo -n "${spinner:$i:1}"
             echo -en "\010"
@@ -66,9 +67,8 @@ function do_spin ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_restart_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/restart"
     done
 }
@@ -77,9 +77,8 @@ function cluster_mgmt_service_restart_all ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_stop_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/stop"
     done
 }
@@ -88,9 +87,8 @@ function cluster_mgmt_service_stop_all ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_start_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/start"
     done
 }
@@ -234,7 +232,7 @@ function main ()
 
     if [[ ${CRED_VALIDATED} == 0 ]]
     then
-        export CM_API_VERSION=$(curl ${CURL_OPTIONS}  -X GET "${CM_SERVER}/api/version")
+        export CM_API_VERSION
     else
         exit 1
     fi
@@ -24,6 +24,7 @@ function do_test_credentials ()
     rm -rf /tmp/null 
   else
     CRED_VALIDATED=0
+    CM_API_VERSION=$(cat /tmp/null)
     rm -rf /tmp/null 
   fi
 }
@@ -71,9 +72,8 @@ function cluster_mgmt_service_restart ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_restart_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/restart"
     done
 }
@@ -82,9 +82,8 @@ function cluster_mgmt_service_restart_all ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_stop_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/stop"
     done
 }
@@ -93,9 +92,8 @@ function cluster_mgmt_service_stop_all ()
 #-----------------------------------------------------------------------
 function cluster_mgmt_service_start_all () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        MGMT_ROLE_TYPE=$(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
         curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -d "{\"items\":[\"${MGMT_ROLE_TYPE}\"]}" -X POST "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleCommands/start"
     done
 }
@@ -210,34 +208,31 @@ function cluster_service_full_restart ()
 #-----------------------------------------------------------------------
 function cluster_control_services_mgmt () 
 {
-    for MGMT_ROLE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].name')
+    for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[].roleType')
     do
-        for MGMT_ROLE_TYPE in $(curl ${CURL_OPTIONS} -H "accept: application/json" -H "Content-Type: application/json" -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups/${MGMT_ROLE}" | jq -r '.roleType')
+        PS3=${PS3_MGMT_SRV}
+        echo -e "\n#== CLUSTER: ${RED}${CM_CLUSTER_NAME}${NC} | SERVICE: ${RED}${MGMT_ROLE_TYPE^^}${NC} ==#\n"
+        select ANSWER in "Start" "Stop" "Restart" "Next Service" "Exit"
         do
-            PS3=${PS3_MGMT_SRV}
-            echo -e "\n#== CLUSTER: ${RED}${CM_CLUSTER_NAME}${NC} | SERVICE: ${RED}${MGMT_ROLE_TYPE^^}${NC} ==#\n"
-            select ANSWER in "Start" "Stop" "Restart" "Next Service" "Exit"
-            do
-                case ${ANSWER} in
-                    "Start")
-                        cluster_mgmt_service_start
-                        ;;
-                    "Stop")
-                        cluster_mgmt_service_stop
-                        ;;
-                    "Restart")
-                        cluster_mgmt_service_restart
-                        ;;
-                    "Next Service")
-                        break
-                        ;;
-                    "Exit")
-                        exit 0
+            case ${ANSWER} in
+                "Start")
+                    cluster_mgmt_service_start
+                    ;;
+                "Stop")
+                    cluster_mgmt_service_stop
+                    ;;
+                "Restart")
+                    cluster_mgmt_service_restart
                     ;;
-                    *) 
-                        echo -e "\nInvalid option, please try again. [-> To get the Menu Press Enter]:\n"
-                esac
-            done
+                "Next Service")
+                    break
+                    ;;
+                "Exit")
+                    exit 0
+                ;;
+                *) 
+                    echo -e "\nInvalid option, please try again. [-> To get the Menu Press Enter]:\n"
+            esac
         done
     done
 }
@@ -360,7 +355,7 @@ function main ()
 
     if [[ ${CRED_VALIDATED} == 0 ]]
     then
-    export CM_API_VERSION=$(curl ${CURL_OPTIONS}  -X GET "${CM_SERVER}/api/version")
+    export CM_API_VERSION
     else
     exit 1
     fi
@@ -22,7 +22,7 @@ function do_spin () {
   spinner="/|\\-/|\\-"
   while :
   do
-    for i in $(seq 0 7)
+    for i in {0..7}
     do
       echo -n "${spinner:$i:1}"
       echo -en "\010"
@@ -60,6 +60,7 @@ then
     rm -rf /tmp/null 
 else
     CRED_VALIDATED=0
+    CM_API_VERSION=$(cat /tmp/null)
     rm -rf /tmp/null 
 fi
 }
@@ -70,12 +71,21 @@ do_get_roles_configs () {
     for CLUSTER_SERIVCE_NAME in $(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services" | jq -r '.items[].name')
     do
         # Retrieves the configuration of a specific service.
-        curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/config?view=summary"  | tee -a ${OUTPUT_DIR}/ServiceConfigs/$(hostname -f)_${CM_CLUSTER_NAME}_${CLUSTER_SERIVCE_NAME}_config.json
+        curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/config?view=summary"  | tee -a ${OUTPUT_DIR}/ServiceConfigs/${CM_HOSTNAME}_${CM_CLUSTER_NAME}_${CLUSTER_SERIVCE_NAME}_config.json
+        ROLE_CONFIG_CURL_ARGS=()
+        ROLE_CONFIG_FILES=()
         for roleConfigName in $(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups" | jq -r '.items[].name')
         do
-            # Retrieves the configuration of a specific role.
-            curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups/${roleConfigName}/config?view=summary" | tee -a ${OUTPUT_DIR}/roleConfigGroups/$(hostname -f)_${CM_CLUSTER_NAME}_${CLUSTER_SERIVCE_NAME}_${roleConfigName}_config.json
+            ROLE_CONFIG_FILE=${OUTPUT_DIR}/roleConfigGroups/${CM_HOSTNAME}_${CM_CLUSTER_NAME}_${CLUSTER_SERIVCE_NAME}_${roleConfigName}_config.json
+            ROLE_CONFIG_CURL_ARGS+=("${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups/${roleConfigName}/config?view=summary" -o "${ROLE_CONFIG_FILE}")
+            ROLE_CONFIG_FILES+=("${ROLE_CONFIG_FILE}")
         done
+        # Retrieves the configuration of every role of the service with a single curl, reusing the same TLS connection.
+        if [[ ${#ROLE_CONFIG_FILES[@]} -gt 0 ]]
+        then
+            curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${ROLE_CONFIG_CURL_ARGS[@]}"
+            cat "${ROLE_CONFIG_FILES[@]}"
+        fi
     done
 }
 
@@ -119,14 +129,15 @@ function main ()
     export CM_DB_USER=$(awk -F"=" '/db.user/ {print $NF}' ${CM_SERVER_DB_FILE})
     export PGPASSWORD=$(awk -F"=" '/db.password/ {print $NF}' ${CM_SERVER_DB_FILE})
     export CM_CLUSTER_NAME=$(echo -e "SELECT name FROM clusters;" | psql -h ${CM_DB_HOST} -U ${CM_DB_USER} -d ${CM_DB_NAME} | grep -v Proxy | tail -n 3 | head -n1| sed 's| ||g')
-    export CM_SERVER="https://$(hostname -f):7183"
-    export OUTPUT_DIR=/tmp/$(hostname -f)/$(date +"%Y%m%d%H%M%S")
+    export CM_HOSTNAME=$(hostname -f)
+    export CM_SERVER="https://${CM_HOSTNAME}:7183"
+    export OUTPUT_DIR=/tmp/${CM_HOSTNAME}/$(date +"%Y%m%d%H%M%S")
 
     do_test_credentials
 
     if [[ ${CRED_VALIDATED} == 0 ]]
     then
-        export CM_API_VERSION=$(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/version")
+        export CM_API_VERSION
     else
         exit 1
     fi
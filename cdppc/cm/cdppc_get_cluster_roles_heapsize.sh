@@ -18,7 +18,7 @@ function do_spin () {
   spinner="/|\\-/|\\-"
   while :
   do
-    for i in $(seq 0 7)
+    for i in {0..7}
     do
       echo -n "${spinner:$i:1}"
       echo -en "\010"
@@ -56,6 +56,7 @@ then
     rm -rf /tmp/null 
 else
     CRED_VALIDATED=0
+    CM_API_VERSION=$(cat /tmp/null)
     rm -rf /tmp/null 
 fi
 }
@@ -63,36 +64,18 @@ fi
 # Function: do_get_roles_heapsize - Get Heap Size for Hadoop Services {{{1
 #-----------------------------------------------------------------------
 do_get_roles_heapsize () {
-    CONT=0
     for CLUSTER_SERIVCE_NAME in $(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services"|jq -r '.items[].name')
     do
     #    echo ${CLUSTER_SERIVCE_NAME}
-        for roleConfigName in $(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups" | jq -r '.items[].name')
-        do
-            #echo ${roleConfigName}
-            #curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups/${roleConfigName}" | jq -r '. | ((.config.items[] | select( .name | contains("heapsize"))|"\(.name) | \(.value)"))' 
-            #curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups/${roleConfigName}" | jq -r '. | (.name, (.config.items[] | select( .name | contains("heapsize"))|"\(.name) | \(.value)"))'  | grep --color -B1 'heap.*[0-9]$'
-            set -- $(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups/${roleConfigName}" | jq -r '. | (.name, (.config.items[] | select( .name | contains("heap"))|"\(.name) \(.value)"))'  | grep --color -B1 'heap.*[0-9]$')
-            for roleConfigValue in $@
-            do
-                roleConfigArray[${CONT}]=${roleConfigValue}
-                (( CONT += 1 ))
-            done 
-        done
+        # The roleConfigGroups list already carries each group's config, no need to GET every group
+        curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/services/${CLUSTER_SERIVCE_NAME}/roleConfigGroups" | jq -r '.items[] | (.name, (.config.items[] | select( .name | contains("heap"))|"\(.name) \(.value)"))'  | grep --color -B1 'heap.*[0-9]$' | sed 's|--||g'
     done
-    echo ${roleConfigArray[*]} | sort -u    
 }
 
 # Function: do_get_role_mgmt_heapsize - Get Heap Size for CM MGMT Services {{{1
 #-----------------------------------------------------------------------
 function do_get_role_mgmt_heapsize () {
-  set -- $(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[] | (.name, (.config.items[] | select( .name | contains("heap"))|"\(.name) \(.value)"))' | grep --color -B1 'heap.*[0-9]$')
-  for roleConfigValue in $@
-  do
-      roleConfigArray[${CONT}]=${roleConfigValue}
-      (( CONT += 1 ))
-  done 
-  echo ${roleConfigArray[*]} | sed 's|--||g' | sort -u
+  curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/cm/service/roleConfigGroups" | jq -r '.items[] | (.name, (.config.items[] | select( .name | contains("heap"))|"\(.name) \(.value)"))' | grep --color -B1 'heap.*[0-9]$' | sed 's|--||g'
 }
 
 # Function: get_roles_running_supervisorctl - Get Roles running in all nodes using salt and supervisorctl {{{1
@@ -151,7 +134,7 @@ function main ()
 
     if [[ ${CRED_VALIDATED} == 0 ]]
     then
-        export CM_API_VERSION=$(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/version")
+        export CM_API_VERSION
     else
         exit 1
     fi
@@ -45,6 +45,7 @@ then
     rm -rf /tmp/null 
 else
     CRED_VALIDATED=0
+    CM_API_VERSION=$(cat /tmp/null)
     rm -rf /tmp/null 
 fi
 }
@@ -53,8 +54,11 @@ fi
 #-----------------------------------------------------------------------
 do_get_cm_cluster_template () {
     # ?exportAutoConfig=true parameter to the command above to include configurations made by Autoconfiguration. These configurations are included for reference only and are not used when you import the template into a new cluster. 
-    curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/export?exportAutoConfig=true" | tee -a ${OUTPUT_DIR}/$(hostname -f)_${CM_CLUSTER_NAME}_clustertemplate_autoconfig.json
-    curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/export" | tee -a ${OUTPUT_DIR}/$(hostname -f)_${CM_CLUSTER_NAME}_clustertemplate.json        
+    # Build the output file prefix once instead of calling hostname for every path
+    TEMPLATE_FILE_PREFIX=${OUTPUT_DIR}/${CM_HOSTNAME}_${CM_CLUSTER_NAME}_clustertemplate
+    # Both exports go through a single curl call so the second request reuses the same TLS connection (keep-alive)
+    curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/export?exportAutoConfig=true" -o ${TEMPLATE_FILE_PREFIX}_autoconfig.json "${CM_SERVER}/api/${CM_API_VERSION}/clusters/${CM_CLUSTER_NAME}/export" -o ${TEMPLATE_FILE_PREFIX}.json
+    cat ${TEMPLATE_FILE_PREFIX}_autoconfig.json ${TEMPLATE_FILE_PREFIX}.json
 }
 
 # Function: main - Call the actions {{{1
@@ -97,14 +101,15 @@ function main ()
     export CM_DB_USER=$(awk -F"=" '/db.user/ {print $NF}' ${CM_SERVER_DB_FILE})
     export PGPASSWORD=$(awk -F"=" '/db.password/ {print $NF}' ${CM_SERVER_DB_FILE})
     export CM_CLUSTER_NAME=$(echo -e "SELECT name FROM clusters;" | psql -h ${CM_DB_HOST} -U ${CM_DB_USER} -d ${CM_DB_NAME} | grep -v Proxy | tail -n 3 | head -n1| sed 's| ||g')
-    export CM_SERVER="https://$(hostname -f):7183"
-    export OUTPUT_DIR=/tmp/$(hostname -f)/$(date +"%Y%m%d%H%M%S")
+    export CM_HOSTNAME=$(hostname -f)
+    export CM_SERVER="https://${CM_HOSTNAME}:7183"
+    export OUTPUT_DIR=/tmp/${CM_HOSTNAME}/$(date +"%Y%m%d%H%M%S")
 
     do_test_credentials
 
     if [[ ${CRED_VALIDATED} == 0 ]]
     then
-        export CM_API_VERSION=$(curl -s -L -k -u ${WORKLOAD_USER}:${WORKLOAD_USER_PASS} -X GET "${CM_SERVER}/api/version")
+        export CM_API_VERSION
     else
         exit 1
     fi
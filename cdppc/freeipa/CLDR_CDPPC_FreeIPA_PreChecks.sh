@@ -102,7 +102,7 @@ function do_spin ()
     spinner="/|\\-/|\\-"
     while :
     do
-        for i in $(seq 0 7)
+        for i in {0..7}
         do
             echo -n "${spinner:$i:1}"
             echo -en "\010"
@@ -151,11 +151,12 @@ function recover_default_salt_master_conf ()
 #-----------------------------------------------------------------------
 function freeipa_services_running ()
 {
-    FREEIPA_SERVICE_LIST="certmonger crond gssproxy httpd ipa-custodia ipa-dnskeysyncd kadmin krb5kdc named-pkcs11 nginx $(systemctl | awk '/pki-tomcatd@/ {print $1}') polkit salt-api salt-bootstrap salt-master salt-minion sshd sssd $(systemctl | awk '/dirsrv@/ {print $1}')"
-    for Service in ${FREEIPA_SERVICE_LIST}
+    SYSTEMD_UNITS=$(systemctl)
+    FREEIPA_SERVICE_LIST="certmonger crond gssproxy httpd ipa-custodia ipa-dnskeysyncd kadmin krb5kdc named-pkcs11 nginx $(echo "${SYSTEMD_UNITS}" | awk '/pki-tomcatd@/ {print $1}') polkit salt-api salt-bootstrap salt-master salt-minion sshd sssd $(echo "${SYSTEMD_UNITS}" | awk '/dirsrv@/ {print $1}')"
+    # A single systemctl show call reports one SubState per unit, in the same order as the list
+    while read Service SERVICE_CURRENT_STATE
     do
-        SERVICE_CURRENT_STATE=$(systemctl status ${Service} | awk '/Active:/ {print $3}')
-        if [[ ${SERVICE_CURRENT_STATE} == "(running)" ]]
+        if [[ ${SERVICE_CURRENT_STATE} == "running" ]]
         then
             echo -e "${Service} [${GREEN}PASS${NC}]"
         else
@@ -163,18 +164,19 @@ function freeipa_services_running ()
             systemctl status ${Service}
             echo
         fi
-    done
+    done < <(paste -d ' ' <(printf "%s\n" ${FREEIPA_SERVICE_LIST}) <(systemctl show -p SubState ${FREEIPA_SERVICE_LIST} | awk -F '=' '/^SubState=/ {print $2}'))
 }
 
 # Function: freeipa_status - Validates FreeIPA services across the IPA nodes {{{1
 #-----------------------------------------------------------------------
 function freeipa_status ()
 {
-    EXIT_COUNT=$(salt '*' cmd.run 'ipactl status' 2>/dev/null | egrep -v 'successful|RUNNING|cloudera\.site' | wc -l)
+    IPACTL_STATUS=$(salt '*' cmd.run 'ipactl status' 2>/dev/null)
+    EXIT_COUNT=$(echo "${IPACTL_STATUS}" | egrep -v 'successful|RUNNING|cloudera\.site' | wc -l)
     if [[ ${EXIT_COUNT} != 0 ]]
     then
         echo -e "Expected Services are running [${RED}FAILED${NC}]"
-        salt '*' cmd.run 'ipactl status' 2>/dev/null
+        echo "${IPACTL_STATUS}"
     else
         echo -e "Expected services are running [${GREEN}PASS${NC}]"
     fi
@@ -195,6 +197,25 @@ function freeipa_cdp_nsm ()
     fi
 }
 
+# Function: freeipa_listening_ports - Validates every required port against one socket snapshot {{{1
+#-----------------------------------------------------------------------
+function freeipa_listening_ports ()
+{
+    # Run lsof and netstat once for all the ports instead of once per port
+    # Only keep the ports from the NAME column (both ends of a connection), so IPv6 address groups never match
+    LSOF_PORTS=$(lsof -i -P -n 2>/dev/null | awk 'NR > 1 {n=$9; split(n,a,"->"); for(i in a){sub(/.*:/,"",a[i]); print a[i]}}' | sort -u)
+    NETSTAT_LISTEN=$(netstat -ptan | awk '/LISTEN/')
+    for PortNumber in ${FREEIPA_REQUIRED_PORTS}
+    do
+        if echo "${LSOF_PORTS}" | grep -x "${PortNumber}" >/dev/null 2>&1
+        then
+            echo -e "${PortNumber}:$(echo "${NETSTAT_LISTEN}" | awk "\$4 ~ /:${PortNumber}\>/" | awk -F '/' '{print $NF}' | sort -u) [${GREEN}PASS${NC}]"
+        else
+            echo -e "\n${PortNumber} [${RED}FAILED${NC}]\n"
+        fi
+    done
+}
+
 # Function: freeipa_checkports - Validates Expected Open Ports {{{1
 #-----------------------------------------------------------------------
 function freeipa_checkports ()
@@ -202,15 +223,7 @@ function freeipa_checkports ()
     echo -e "\n${YELLOW}[02|01] FreeIPA Listenig Ports${NC}\n"
     if rpm -q lsof >/dev/null 2>&1
     then
-        for PortNumber in 22 88 1080 53 80 3080 749 464 8005 8009 8080 8443 4505 4506 389 636
-        do
-            if lsof -i :${PortNumber} >/dev/null 2>&1
-            then
-                echo -e "${PortNumber}:$(netstat -ptan | awk "\$4 ~ /:${PortNumber}\>/ && \$0 ~ /LISTEN/" | awk -F '/' '{print $NF}' | sort -u) [${GREEN}PASS${NC}]"
-            else
-                echo -e "\n${PortNumber} [${RED}FAILED${NC}]\n"
-            fi
-        done
+        freeipa_listening_ports
     else
         echo -e "lsof package is required to run this test\nPlease consider installing the package by running: ${RED}yum install -y lsof${NC}"
         echo -en "${GREEN}Would you like to install it? (Y/N): ${NC}"
@@ -229,15 +242,7 @@ function freeipa_checkports ()
 
                 if rpm -q lsof >/dev/null 2>&1
                 then
-                    for PortNumber in 22 88 1080 53 80 3080 749 464 8005 8009 8080 8443 4505 4506 389 636
-                    do
-                        if lsof -i :${PortNumber} >/dev/null 2>&1
-                        then
-                            echo -e "${PortNumber}:$(netstat -ptan | awk "\$4 ~ /:${PortNumber}\>/ && \$0 ~ /LISTEN/" | awk -F '/' '{print $NF}' | sort -u) [${GREEN}PASS${NC}]"
-                        else
-                            echo -e "\n${PortNumber} [${RED}FAILED${NC}]\n"
-                        fi
-                    done
+                    freeipa_listening_ports
                 else
                     echo -e "It seems the package did not get installed ...Ignoring this test"
                     echo -e "\nCDP Required Service Check [${RED}FAILED${NC}]\n"
@@ -360,35 +365,35 @@ function freeipa_cdp_nsm_report ()
     salt '*' cmd.run "systemctl status \${NSM_NAME}" 2>/dev/null
 }
 
+function freeipa_listening_ports_report ()
+{
+    # One lsof and netstat snapshot for all the ports, only keeping the ports from the lsof NAME column
+    LSOF_PORTS=\$(lsof -i -P -n 2>/dev/null | awk 'NR > 1 {n=\$9; split(n,a,"->"); for(i in a){sub(/.*:/,"",a[i]); print a[i]}}' | sort -u)
+    NETSTAT_LISTEN=\$(netstat -ptan | awk '/LISTEN/')
+    NETSTAT_LN46=\$(netstat -ln46)
+    for PortNumber in ${FREEIPA_REQUIRED_PORTS}
+    do
+        if echo "\${LSOF_PORTS}" | grep -x "\${PortNumber}" >/dev/null 2>&1
+        then
+            echo -e "\n\${1}\${PortNumber}:\$(echo "\${NETSTAT_LISTEN}" | awk "\\\$4 ~ /:\${PortNumber}\>/" | awk -F '/' '{print \$NF}' | sort -u)\n"
+            echo "\${NETSTAT_LN46}" | awk "/:\${PortNumber}\\>/" | sort -u
+        else
+            echo -e "\nCDP Required Service on port \${PortNumber} is not LISTENING\n"
+        fi
+    done
+}
+
 function freeipa_checkports_report ()
 {
     if rpm -q lsof >/dev/null 2>&1
     then
-        for PortNumber in 22 88 1080 53 80 3080 749 464 8005 8009 8080 8443 4505 4506 389 636
-        do
-            if lsof -i :\${PortNumber} >/dev/null 2>&1
-            then
-                echo -e "\n\${PortNumber}:\$(netstat -ptan | awk "\\\$4 ~ /:\${PortNumber}\>/ && \\\$0 ~ /LISTEN/" | awk -F '/' '{print \$NF}' | sort -u)\n"
-                netstat -ln46 | awk "/:\${PortNumber}\\>/" | sort -u
-            else
-                echo -e "\nCDP Required Service on port \${PortNumber} is not LISTENING\n"
-            fi
-        done
+        freeipa_listening_ports_report
     else
         yum install -y lsof
         rpm -q lsof >/dev/null 2>&1
         if [[ \$? == 0 ]]
         then
-            for PortNumber in 22 88 1080 53 80 3080 749 464 8005 8009 8080 8443 4505 4506 389 636
-            do
-                if lsof -i :\${PortNumber} >/dev/null 2>&1
-                then
-                    echo -e "\nCDP Required Service: \${PortNumber}:\$(netstat -ptan | awk "\\\$4 ~ /:\${PortNumber}\>/ && \\\$0 ~ /LISTEN/" | awk -F '/' '{print \$NF}' | sort -u)\n"
-                    netstat -ln46 | awk "/:\${PortNumber}\\>/" | sort -u
-                else
-                    echo -e "\nCDP Required Service on port \${PortNumber} is not LISTENING\n"
-                fi
-            done
+            freeipa_listening_ports_report "CDP Required Service: "
         else
             echo -e "\nlsof package couldn't be installed\n"
         fi
@@ -460,7 +465,7 @@ function freeipa_test_backup_report ()
 
 function freeipa_cipa_state_report ()
 {
-    /usr/local/bin/cipa -d \$(hostname -d) -W \$(tail -n +2 /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password')
+    /usr/local/bin/cipa -d \$(hostname -d) -W \${PW}
 }
 
 function freeipa_create_ldap_conflict_file ()
@@ -482,7 +487,7 @@ function freeipa_get_idns_in_conflicts ()
 
 function freeipa_ldap_conflicts_check ()
 {
-    LDAP_CONFLICTS_CHECK=\$(/usr/local/bin/cipa -d \$(hostname -d) -W \$(tail -n +2 /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password') | awk '/LDAP Conflicts/ {print \$5,\$7,\$9}' | grep 0 >/dev/null 2>&1 && echo \$?)
+    LDAP_CONFLICTS_CHECK=\$(/usr/local/bin/cipa -d \$(hostname -d) -W \${PW} | awk '/LDAP Conflicts/ {print \$5,\$7,\$9}' | grep 0 >/dev/null 2>&1 && echo \$?)
     if [[ \${LDAP_CONFLICTS_CHECK} -eq 0 ]]
     then
         echo -e "No FreeIPA LDAP Conflicts\n"
@@ -634,10 +639,11 @@ function main_report ()
 }
 
 export LDAP_CONFLICTS_FILE=/tmp/LDAP_CONFLICTS.txt
-export LDAP_SRV=\$(sed '1d' /srv/pillar/freeipa/init.sls | jq -r '.freeipa.hosts[].fqdn' | tail -n 1)
+FREEIPA_PILLAR=\$(sed '1d' /srv/pillar/freeipa/init.sls)
+export LDAP_SRV=\$(echo "\${FREEIPA_PILLAR}" | jq -r '.freeipa.hosts[].fqdn' | tail -n 1)
 export BIND_DN="cn=Directory Manager"
-export PRINCIPAL=\$(sed '1d' /srv/pillar/freeipa/init.sls | jq -r '.freeipa.admin_user')
-export PW=\$(sed '1d' /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password')
+export PRINCIPAL=\$(echo "\${FREEIPA_PILLAR}" | jq -r '.freeipa.admin_user')
+export PW=\$(echo "\${FREEIPA_PILLAR}" | jq -r '.freeipa.password')
 echo \${PW} | kinit \${PRINCIPAL} >/dev/null 2>&1
 source activate_salt_env
 main_report
@@ -678,14 +684,15 @@ function freeipa_reverse_dns ()
 #-----------------------------------------------------------------------
 function freeipa_check_nginx ()
 {
-    NGINX_FILE_STATE=$(salt '*' cmd.run 'md5sum /etc/nginx/nginx.conf' 2>/dev/null | awk '/nginx/ {print $1}' | sort -u | wc -l)
+    NGINX_MD5SUM=$(salt '*' cmd.run 'md5sum /etc/nginx/nginx.conf' 2>/dev/null)
+    NGINX_FILE_STATE=$(echo "${NGINX_MD5SUM}" | awk '/nginx/ {print $1}' | sort -u | wc -l)
     if [[ ${NGINX_FILE_STATE} -eq 1 ]]
     then
         echo -e "Double-check nginx.conf [${GREEN}PASS${NC}]"
         echo -e "Please save locally a copy of ${RED}/etc/nginx/nginx.conf${NC}"
     else
         echo -e "\nDouble-check nginx.conf [${RED}FAILED${NC}]\n"
-        salt '*' cmd.run 'md5sum /etc/nginx/nginx.conf' 2>/dev/null
+        echo "${NGINX_MD5SUM}"
     fi
 }
 
@@ -718,13 +725,14 @@ function freeipa_test_backup ()
 #-----------------------------------------------------------------------
 function freeipa_cipa_state ()
 {
-    CIPA_STATUS=$( /usr/local/bin/cipa -d $(hostname -d) -W $(tail -n +2 /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password') | sed -ne '3,$p' | awk '/[^\+-]/ {print $(NF -1)}' | sort -u | grep -v '|$' | wc -l)
+    CIPA_OUTPUT=$(/usr/local/bin/cipa -d $(hostname -d) -W ${PW})
+    CIPA_STATUS=$(echo "${CIPA_OUTPUT}" | sed -ne '3,$p' | awk '/[^\+-]/ {print $(NF -1)}' | sort -u | grep -v '|$' | wc -l)
     if [[  ${CIPA_STATUS} -eq 1 ]]
     then
         echo -e "FreeIPA Replication CIPA test [${GREEN}PASS${NC}]"
     else
         echo -e "\nFreeIPA Replication CIPA test [${RED}FAILED${NC}]\n"
-        /usr/local/bin/cipa -d $(hostname -d) -W $(tail -n +2 /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password')
+        echo "${CIPA_OUTPUT}"
     fi
 }
 
@@ -739,27 +747,27 @@ function freeipa_create_ldap_conflict_file ()
 #-----------------------------------------------------------------------
 function freeipa_get_user_group_in_conflicts ()
 {
-    ldapsearch -H ldap://${LDAP_SRV} -o ldif-wrap=no -D "${BIND_DN}" -w ${PW} "(&(objectClass=ldapSubEntry)(nsds5ReplConflict=*))" \* nsds5ReplConflict | awk -F '[ |=|,]' '/nsds5ReplConflict.*cn=users/ || /nsds5ReplConflict.*cn=groups/ {print $5}' | sort -u
+    awk -F '[ |=|,]' '/nsds5ReplConflict.*cn=users/ || /nsds5ReplConflict.*cn=groups/ {print $5}' ${LDAP_CONFLICTS_FILE} | sort -u
 }
 
 # Function: freeipa_get_idns_in_conflicts - Get hosts LDAP conflicts {{{1
 #-----------------------------------------------------------------------
 function freeipa_get_idns_in_conflicts ()
 {
-    ldapsearch -H ldap://${LDAP_SRV} -o ldif-wrap=no -D "${BIND_DN}" -w ${PW} "(&(objectClass=ldapSubEntry)(nsds5ReplConflict=*))" \* nsds5ReplConflict | awk -F '[ |=|,]' '/nsds5ReplConflict.*idnsName=/ {print $5}' | sort -u
+    awk -F '[ |=|,]' '/nsds5ReplConflict.*idnsName=/ {print $5}' ${LDAP_CONFLICTS_FILE} | sort -u
 }
 
 # Function: freeipa_ldap_conflicts_check - Check and report if there are LDAP conflicts {{{1
 #-----------------------------------------------------------------------
 function freeipa_ldap_conflicts_check ()
 {
-    LDAP_CONFLICTS_CHECK=$(/usr/local/bin/cipa -d $(hostname -d) -W $(tail -n +2 /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password') | awk '/LDAP Conflicts/ {print $5,$7,$9}' | grep 0 >/dev/null 2>&1 && echo $?)
+    LDAP_CONFLICTS_CHECK=$(/usr/local/bin/cipa -d $(hostname -d) -W ${PW} | awk '/LDAP Conflicts/ {print $5,$7,$9}' | grep 0 >/dev/null 2>&1 && echo $?)
     if [[ ${LDAP_CONFLICTS_CHECK} -eq 0 ]]
     then
         echo -e "FreeIPA LDAP Conflicts [${GREEN}PASS${NC}]"
     else
         echo -e "\nFreeIPA LDAP Conflicts [${RED}FAILED${NC}]\n"
-        USER_GROUP_LDAP_CONFLICT=$(ldapsearch -H ldap://${LDAP_SRV} -o ldif-wrap=no -D "${BIND_DN}" -w ${PW} "(&(objectClass=ldapSubEntry)(nsds5ReplConflict=*))" \* nsds5ReplConflict | awk -F '[ |=|,]' '/nsds5ReplConflict.*cn=users/ || /nsds5ReplConflict.*cn=groups/ {print $5}' | sort -u | wc -l)
+        USER_GROUP_LDAP_CONFLICT=$(awk -F '[ |=|,]' '/nsds5ReplConflict.*cn=users/ || /nsds5ReplConflict.*cn=groups/ {print $5}' ${LDAP_CONFLICTS_FILE} | sort -u | wc -l)
         if [[ ${USER_GROUP_LDAP_CONFLICT} -ne 0 ]]
         then
             echo -e "${RED}Users or Groups in Conflict${NC}"
@@ -776,19 +784,16 @@ function freeipa_ldap_conflicts_check ()
 function freeipa_replication_agreements ()
 {
     # Status of replication between IPA servers
-    FREEIPA_REPLICA_AGREEMENTS=$(for REPLICA in $(ipa-replica-manage list | awk '{print $1}' | tr -d ":"); do ipa-replica-manage -v list ${REPLICA}; echo ;done | awk '/last update status:/' | sort -u)
+    FREEIPA_REPLICA_DETAILS=$(for REPLICA in $(ipa-replica-manage list | awk '{print $1}' | tr -d ":"); do echo -e "${YELLOW}${REPLICA}${NC}\n"; ipa-replica-manage -v list ${REPLICA}; echo ;done)
+    FREEIPA_REPLICA_AGREEMENTS=$(echo "${FREEIPA_REPLICA_DETAILS}" | awk '/last update status:/' | sort -u)
     # last update status: Error (0) Replica acquired successfully: Incremental update succeeded
     if [[  ${FREEIPA_REPLICA_AGREEMENTS} =~ succeeded$ ]]
     then
         echo -e "FreeIPA Replication Agreements [${GREEN}PASS${NC}]"
     else
         echo -e "\nFreeIPA Replication Agreements [${RED}FAILED${NC}]\n"
-        for IPA_NODE in $(ipa-replica-manage list | awk '{print $1}' | tr -d ":")
-        do
-            echo -e "${YELLOW}${IPA_NODE}${NC}\n"
-            ipa-replica-manage -v list ${IPA_NODE}
-            echo
-        done
+        echo "${FREEIPA_REPLICA_DETAILS}"
+        echo
     fi
 }
 
@@ -908,6 +913,8 @@ salt '*' cmd.run '
 function freeipa_duplicated_forward_dns_entries ()
 {
     set -- $(ipa server-find --pkey-only  |  awk -F "[:]" '/Server/ {print "host -t A"$NF}' | bash | awk '{print $NF}')
+    # Number of IPA servers, computed once instead of per A record
+    IPA_SERVER_COUNT=$#
     FREEIPA_DOMAIN=$(salt-call pillar.get freeipa:domain --out=json 2>/dev/null | jq -r '.local')
     for DNS_FORWARD_ZONE in $(ipa dnszone-find | awk -F":" '/Zone/ &&  $0 !~ /arpa/ {print $2}' | sed 's/ //g')
     do
@@ -916,7 +923,7 @@ function freeipa_duplicated_forward_dns_entries ()
             if [[ ${A_RECORD} == ipa-ca ]]
             then
                 #ipa-ca should respond to the same ipa server records
-                if [[ $(host -t A ipa-ca | wc -l) == $(ipa server-find --pkey-only  |  awk -F "[:]" '/Server/ {print "host -t A"$NF}' | bash | awk '{print $NF}' | wc -l) ]]
+                if [[ $(host -t A ipa-ca | wc -l) == ${IPA_SERVER_COUNT} ]]
                 then
                     echo -e "${A_RECORD}.${FREEIPA_DOMAIN} [${GREEN}PASS${NC}]"
                 else
@@ -945,16 +952,17 @@ function freeipa_duplicated_reverse_dns_entries ()
     do
         echo -e "\n${DNS_REVERSE_ZONE}\n"
         ipa dnsrecord-find ${DNS_REVERSE_ZONE} | awk -F ":" '/Record.*[0-9]+/ || /PTR record/' | awk -F":" '/PTR record:/ {print $NF}' | sed 's/ //g' > /tmp/dns-${T_STAMP}
-        for PTR_RECORD in $(ipa dnsrecord-find ${DNS_REVERSE_ZONE} | awk -F ":" '/Record.*[0-9]+/ || /PTR record/' | awk -F":" '/PTR record:/ {print $NF}' | sed 's/ //g')
+        # Count every PTR record in one pass (first read) and tag each record with its count (second read)
+        while read PTR_COUNT PTR_RECORD
         do
-            if [[ $(grep -c ${PTR_RECORD} /tmp/dns-${T_STAMP}) -eq 1 ]]
+            if [[ ${PTR_COUNT} -eq 1 ]]
             then
                 echo -e "${PTR_RECORD} [${GREEN}PASS${NC}]"
             else
                 echo -e "\n${PTR_RECORD} [${RED}FAILED${NC}]\n"
                 ipa dnsrecord-find ${DNS_REVERSE_ZONE} | grep --color -B1 "${PTR_RECORD}"
             fi
-        done
+        done < <(awk 'NR == FNR {count[$0]++; next} {print count[$0], $0}' /tmp/dns-${T_STAMP} /tmp/dns-${T_STAMP})
     done
     rm -rf /tmp/dns-${T_STAMP}
 }
@@ -1134,11 +1142,8 @@ function main ()
     freeipa_create_remote_scripts
     # Get the list of ipa nodes
     set -- $(salt-key --out json 2>/dev/null | jq -r '.minions[]' | egrep 'ipa')
-    for FILES_TO_COPY in ${FILES2COPY}
-    do
-        # Copy the scripts to IPA nodes
-        salt-cp --chunked --list "$(echo $@ | sed 's| |,|g')" /home/cloudbreak/${FILES_TO_COPY} /tmp/${FILES_TO_COPY} >/dev/null 2>&1
-    done
+    # Copy all the scripts to IPA nodes in a single salt-cp call (one salt job instead of one per file)
+    salt-cp --chunked --list "$(echo $@ | sed 's| |,|g')" $(printf "/home/cloudbreak/%s " ${FILES2COPY}) /tmp/ >/dev/null 2>&1
     kill -9 $SPIN_PID 2>/dev/null
     wait $SPIN_PID >/dev/null 2>&1
 
@@ -1184,9 +1189,13 @@ export LDAP_CONFLICTS_FILE=/tmp/LDAP_CONFLICTS.txt
 export FILES2COPY="freeipa_disk_precheck.sh freeipa_memory_precheck.sh freeipa_cpu_precheck.sh freeipa_functions_create_report.sh"
 export FILES2EXEC_HEALTHCHECK="freeipa_disk_precheck.sh freeipa_memory_precheck.sh freeipa_cpu_precheck.sh"
 export FILES2EXEC_REPORT="freeipa_functions_create_report.sh"
-export LDAP_SRV=$(sed '1d' /srv/pillar/freeipa/init.sls | jq -r '.freeipa.hosts[].fqdn' | tail -n 1)
+# TCP ports the FreeIPA services must be LISTENING on, shared by the local and the remote checks
+export FREEIPA_REQUIRED_PORTS="22 88 1080 53 80 3080 749 464 8005 8009 8080 8443 4505 4506 389 636"
+# Read the FreeIPA pillar once and reuse it for every value below
+FREEIPA_PILLAR=$(sed '1d' /srv/pillar/freeipa/init.sls)
+export LDAP_SRV=$(echo "${FREEIPA_PILLAR}" | jq -r '.freeipa.hosts[].fqdn' | tail -n 1)
 export BIND_DN="cn=Directory Manager"
-export PRINCIPAL=$(sed '1d' /srv/pillar/freeipa/init.sls | jq -r '.freeipa.admin_user')
-export PW=$(sed '1d' /srv/pillar/freeipa/init.sls | jq -r '.freeipa.password')
+export PRINCIPAL=$(echo "${FREEIPA_PILLAR}" | jq -r '.freeipa.admin_user')
+export PW=$(echo "${FREEIPA_PILLAR}" | jq -r '.freeipa.password')
 echo ${PW} | kinit ${PRINCIPAL} >/dev/null 2>&1
 main
\ No newline at end of file